@@ -0,0 +1,76 @@
+import asyncio
+
+from serwer import LIMIT_LINII
+
+
+# =============================================================================
+# KLIENT SERWERA DRZEWA
+#
+# Przykład:
+#   klient = await Klient.polacz('127.0.0.1', 8765)
+#   await klient.polecenie("generuj AVL losowy 100000")
+#   wyniki = await klient.polecenia([f"szukaj {k}" for k in klucze])
+#   await klient.zamknij()
+# =============================================================================
+
+class Klient:
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def polacz(cls, host='127.0.0.1', port=8765, sciezka=None):
+        """
+        Łączy się z serwerem drzewa przez TCP lub gniazdo uniksowe.
+
+        :param host: Adres serwera.
+        :param port: Port serwera.
+        :param sciezka: Ścieżka gniazda uniksowego; jeśli podana, zamiast TCP.
+        :return: Połączony klient.
+        """
+        if sciezka is not None:
+            reader, writer = await asyncio.open_unix_connection(sciezka, limit=LIMIT_LINII)
+        else:
+            reader, writer = await asyncio.open_connection(host, port, limit=LIMIT_LINII)
+        return cls(reader, writer)
+
+    async def polecenie(self, linia):
+        """
+        Wysyła jedno polecenie i czeka na wynik.
+
+        :param linia: Polecenie, np. "szukaj 5".
+        :return: Linia wyniku (bez znaku nowej linii).
+        """
+        return (await self.polecenia([linia]))[0]
+
+    async def polecenia(self, linie):
+        """
+        Wysyła potokowo wiele poleceń, nie czekając na odpowiedzi.
+        Wysyłanie i odbiór działają równolegle – inaczej przy długiej serii obie
+        strony mogłyby utknąć na pełnych buforach.
+
+        :param linie: Lista poleceń.
+        :return: Lista wyników w kolejności poleceń.
+        """
+        async def wysylaj():
+            for i in range(0, len(linie), 1000):
+                self.writer.write("".join(linia + "\n" for linia in linie[i:i + 1000]).encode())
+                await self.writer.drain()
+
+        nadawca = asyncio.create_task(wysylaj())
+        try:
+            wyniki = []
+            for _ in linie:
+                linia = await self.reader.readline()
+                if not linia:
+                    raise ConnectionError("serwer zamknął połączenie")
+                wyniki.append(linia.decode().rstrip("\n"))
+            await nadawca
+        finally:
+            nadawca.cancel()
+        return wyniki
+
+    async def zamknij(self):
+        """Zamyka połączenie z serwerem."""
+        self.writer.close()
+        await self.writer.wait_closed()
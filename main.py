@@ -1,7 +1,12 @@
 import os
+import contextlib
 import time
 import random
 import sys
+import math
+import heapq
+from collections import Counter, deque
+import threading
 
 sys.setrecursionlimit(10 ** 6)
 
@@ -14,6 +19,7 @@ class Node:
         self.key = value
         self.left = None
         self.right = None
+        self.ile = 1  # liczba powtórzeń klucza (tryb licz_duplikaty)
 
 
 # =============================================================================
@@ -24,8 +30,12 @@ class Node:
 # - Funkcja AVL buduje zbalansowane drzewo (AVL) na podstawie posortowanej listy.
 # - Funkcja FCFS tworzy BST według kolejności wstawiania (First-Come, First-Served).
 # - Funkcje HMIN budują kopiec minimalny jako drzewo.
+#
+# Gdy licz_duplikaty jest ustawione, powtórzony klucz nie tworzy nowego węzła,
+# tylko zwiększa licznik ile w istniejącym węźle.
 # =============================================================================
 is_HMIN = False
+licz_duplikaty = False
 
 def AVL(lst):
     """
@@ -39,28 +49,32 @@ def AVL(lst):
     if not lst:
         return None
     mediana = len(lst) // 2
-    node = Node(lst[mediana])
-    # Rekurencyjne budowanie lewego i prawego poddrzewa
-    node.right = AVL(lst[:mediana])
-    node.left = AVL(lst[mediana + 1:])
-    return node
+    # Rekurencyjne budowanie lewego i prawego poddrzewa. Węzeł trwały pamięta
+    # swoją wysokość, więc drzewo można bez kopiowania dzielić i łączyć
+    # (podziel_drzewo, polacz_drzewa) oraz modyfikować wstaw_trwale/usun_trwale.
+    return WezelTrwaly(lst[mediana], AVL(lst[mediana + 1:]), AVL(lst[:mediana]))
 
 
-def FCFS(root, key):
+def FCFS(root, key, ile=1):
     """
     Wstawia nowy element do BST metodą FCFS (kolejność przybycia).
     Nie wykonuje operacji równoważenia, przez co struktura drzewa zależy od kolejności wstawiania.
 
     :param root: Korzeń drzewa.
     :param key: Wstawiany klucz.
+    :param ile: Liczba wstawianych powtórzeń klucza (tryb licz_duplikaty).
     :return: Korzeń drzewa po wstawieniu.
     """
     if root is None:
-        return Node(key)
-    if key < root.key:
-        root.left = FCFS(root.left, key)
+        node = Node(key)
+        node.ile = ile
+        return node
+    if licz_duplikaty and key == root.key:
+        root.ile += ile
+    elif key < root.key:
+        root.left = FCFS(root.left, key, ile)
     else:
-        root.right = FCFS(root.right, key)
+        root.right = FCFS(root.right, key, ile)
     return root
 
 
@@ -90,8 +104,11 @@ def szukanie_elementu(node, n):
             return None
         if node.key == n:
             return node
-        return szukanie_elementu(node.left, n)
-        return szukanie_elementu(node.right, n)
+        # W kopcu nie ma uporządkowania lewo/prawo – przeszukujemy oba poddrzewa,
+        # pomijając te, których korzeń jest już większy od szukanego klucza
+        if n < node.key:
+            return None
+        return szukanie_elementu(node.left, n) or szukanie_elementu(node.right, n)
     else:
         if node is None:
             return None
@@ -163,7 +180,7 @@ def print_tree(node, prefix="", is_left=True):
     """
     if node is not None and node.key is not None:
         print_tree(node.right, prefix + ("│   " if is_left else "    "), False)
-        print(prefix + ("└── " if is_left else "┌── ") + str(node.key))
+        print(prefix + ("└── " if is_left else "┌── ") + str(node.key) + (f" (x{node.ile})" if node.ile > 1 else ""))
         print_tree(node.left, prefix + ("    " if is_left else "│   "), True)
 
 
@@ -229,7 +246,7 @@ def wypisz_malejaco(node):
     def collect_keys(node):
         if node is None:
             return []
-        return collect_keys(node.left) + [node.key] + collect_keys(node.right)
+        return collect_keys(node.left) + [node.key] * node.ile + collect_keys(node.right)
 
     if is_HMIN:
         nodes = list(collect_keys(node))
@@ -238,10 +255,101 @@ def wypisz_malejaco(node):
     else:
         if node:
             wypisz_malejaco(node.right)
-            print(node.key, end=" ")
+            for _ in range(node.ile):
+                print(node.key, end=" ")
             wypisz_malejaco(node.left)
 
 
+def klucze_malejaco(node):
+    """
+    Generator zwracający klucze BST w porządku malejącym (odwrotny in-order).
+    Wersja iteracyjna z jawnym stosem – nie zagłębia się w rekurencję dla
+    zdegenerowanych drzew FCFS.
+
+    :param node: Korzeń drzewa.
+    """
+    stos = []
+    while stos or node:
+        while node:
+            stos.append(node)
+            node = node.right
+        node = stos.pop()
+        for _ in range(node.ile):
+            yield node.key
+        node = node.left
+
+
+def klucze_poziomami(node):
+    """
+    Generator zwracający klucze drzewa poziomami (BFS), każdy tyle razy, ile
+    wynosi jego licznik. Wstawienie ich w tej kolejności metodą FCFS odtwarza
+    kształt drzewa.
+
+    :param node: Korzeń drzewa.
+    """
+    kolejka = deque([node] if node else [])
+    while kolejka:
+        node = kolejka.popleft()
+        for _ in range(node.ile):
+            yield node.key
+        if node.left:
+            kolejka.append(node.left)
+        if node.right:
+            kolejka.append(node.right)
+
+
+def ustaw_liczniki(node, licznik):
+    """
+    Ustawia w każdym węźle liczbę powtórzeń klucza (tryb licz_duplikaty).
+    Używane po zbudowaniu drzewa z unikalnych kluczy (AVL, HMIN).
+
+    :param node: Korzeń drzewa.
+    :param licznik: Słownik klucz -> liczba powtórzeń.
+    """
+    stos = [node]
+    while stos:
+        node = stos.pop()
+        if node is not None:
+            node.ile = licznik[node.key]
+            stos.append(node.left)
+            stos.append(node.right)
+
+
+def elementy_z_zakresu(node, a, b):
+    """
+    Zwraca rosnącą listę kluczy z przedziału [a, b].
+    W BST pomijamy poddrzewa leżące w całości poza przedziałem, w HMIN pomijamy
+    poddrzewa, których korzeń jest większy od b.
+
+    :param node: Korzeń drzewa.
+    :param a: Dolna granica przedziału.
+    :param b: Górna granica przedziału.
+    :return: Lista kluczy z przedziału.
+    """
+    wynik = []
+    stos = [node]
+    while stos:
+        node = stos.pop()
+        if node is None:
+            continue
+        if is_HMIN:
+            if node.key > b:
+                continue
+            if node.key >= a:
+                wynik.extend([node.key] * node.ile)
+            stos.append(node.left)
+            stos.append(node.right)
+        else:
+            if node.key >= a:
+                stos.append(node.left)
+            if a <= node.key <= b:
+                wynik.extend([node.key] * node.ile)
+            if node.key <= b:
+                stos.append(node.right)
+    wynik.sort()
+    return wynik
+
+
 # =============================================================================
 # Funkcje do budowy kopca minimalnego (HMIN) jako drzewa
 #
@@ -385,14 +493,17 @@ def get_min(node):
     return node
 
 
-def usun_wezel(root, key):
-    """Usuwa węzeł o podanym kluczu z BST"""
+def usun_wezel(root, key, wszystkie=False):
+    """Usuwa węzeł o podanym kluczu z BST (w trybie licz_duplikaty zmniejsza licznik,
+    chyba że wszystkie=True)"""
     if root is None:
         return root
     if key < root.key:
-        root.left = usun_wezel(root.left, key)
+        root.left = usun_wezel(root.left, key, wszystkie)
     elif key > root.key:
-        root.right = usun_wezel(root.right, key)
+        root.right = usun_wezel(root.right, key, wszystkie)
+    elif licz_duplikaty and root.ile > 1 and not wszystkie:
+        root.ile -= 1
     else:
         # Brak dzieci lub jedno dziecko
         if root.left is None:
@@ -402,12 +513,12 @@ def usun_wezel(root, key):
         # Zastepujemy usuwany element wezlem z poddrzewa o najwiekszej wysokosci
         if wysokosc(root.right) > wysokosc(root.left):
             temp = get_min(root.right)
-            root.key = temp.key
-            root.right = usun_wezel(temp.right, temp.key)
+            root.key, root.ile = temp.key, temp.ile
+            root.right = usun_wezel(root.right, temp.key, True)
         else:
             temp = get_max(root.left)
-            root.key = temp.key
-            root.left = usun_wezel(root.left, temp.key)
+            root.key, root.ile = temp.key, temp.ile
+            root.left = usun_wezel(root.left, temp.key, True)
     return root
 
 
@@ -418,13 +529,412 @@ def rownowazenie_drzewa(root):
         if unbalanced is None:
             break  # Drzewo jest zrównoważone
 
-        element_do_dodania = unbalanced.key
-        root = usun_wezel(root, unbalanced.key)  # Usuwamy zastępczy węzeł
-        root = FCFS(root, element_do_dodania)  # Wstawiamy go ponownie
+        element_do_dodania, ile = unbalanced.key, unbalanced.ile
+        root = usun_wezel(root, unbalanced.key, True)  # Usuwamy zastępczy węzeł
+        root = FCFS(root, element_do_dodania, ile)  # Wstawiamy go ponownie
 
     return root
 
 
+# =============================================================================
+# RÓWNOWAŻENIE PRZYROSTOWE (SCAPEGOAT)
+#
+# Zamiast jednorazowego rownowazenie_drzewa, wstawianie FCFS sprawdza głębokość
+# nowego węzła. Jeśli przekracza log_{1/alfa}(n), idziemy w górę ścieżki do
+# pierwszego węzła, którego jedno poddrzewo ma więcej niż alfa jego węzłów
+# ("kozioł ofiarny"), i przebudowujemy tylko to poddrzewo w czasie liniowym.
+# Węzły nie przechowują dodatkowych danych – liczność dotyczy całego drzewa
+# i trzymana jest razem z korzeniem w obiekcie StanDrzewa.
+# =============================================================================
+ALFA_SCAPEGOAT = 0.7
+
+
+class StanDrzewa:
+    """
+    Korzeń drzewa wraz z danymi dotyczącymi całego drzewa: typem oraz
+    licznością potrzebną drzewu scapegoat.
+    """
+
+    def __init__(self, typ=None, root=None):
+        self.typ = typ
+        self.root = root
+        self.rozmiar = 0       # liczba węzłów
+        self.max_rozmiar = 0   # największa liczba węzłów od ostatniej pełnej przebudowy
+        self.schowek = None    # drzewo z kluczami >= k odłożone przez polecenie podziel
+
+
+def rozmiar(node):
+    """Liczy węzły poddrzewa (iteracyjnie)."""
+    licznik = 0
+    stos = [node]
+    while stos:
+        node = stos.pop()
+        if node is not None:
+            licznik += 1
+            stos.append(node.left)
+            stos.append(node.right)
+    return licznik
+
+
+def przebuduj_poddrzewo(node):
+    """
+    Przebudowuje poddrzewo w idealnie zbalansowane, wykorzystując istniejące węzły.
+    Spłaszcza poddrzewo in-order do listy węzłów i łączy je od nowa (jak AVL),
+    w czasie liniowym względem rozmiaru poddrzewa.
+
+    :param node: Korzeń przebudowywanego poddrzewa.
+    :return: Nowy korzeń poddrzewa.
+    """
+    wezly, stos = [], []
+    while stos or node:
+        while node:
+            stos.append(node)
+            node = node.left
+        node = stos.pop()
+        wezly.append(node)
+        node = node.right
+
+    def polacz(lo, hi):
+        if lo >= hi:
+            return None
+        mediana = (lo + hi) // 2
+        wezel = wezly[mediana]
+        wezel.left = polacz(lo, mediana)
+        wezel.right = polacz(mediana + 1, hi)
+        return wezel
+
+    return polacz(0, len(wezly))
+
+
+def FCFS_scapegoat(drzewo, key, alfa=ALFA_SCAPEGOAT):
+    """
+    Wstawia klucz metodą FCFS, a przy przekroczeniu dopuszczalnej głębokości
+    przebudowuje poddrzewo kozła ofiarnego. Zamortyzowany koszt O(log n),
+    wysokość ograniczona przez log_{1/alfa}(n) + 1.
+
+    :param drzewo: StanDrzewa (korzeń i liczność drzewa), aktualizowany w miejscu.
+    :param key: Wstawiany klucz.
+    :param alfa: Współczynnik zrównoważenia (0.5 < alfa < 1).
+    :return: Korzeń drzewa po wstawieniu (może się zmienić przy przebudowie).
+    """
+    root = drzewo.root
+    nowy = Node(key)
+    if root is None:
+        drzewo.rozmiar = drzewo.max_rozmiar = 1
+        drzewo.root = nowy
+        return nowy
+
+    sciezka = []
+    node = root
+    while node:
+        if licz_duplikaty and key == node.key:
+            node.ile += 1
+            return root
+        sciezka.append(node)
+        node = node.left if key < node.key else node.right
+    drzewo.rozmiar += 1
+    drzewo.max_rozmiar = max(drzewo.max_rozmiar, drzewo.rozmiar)
+    if key < sciezka[-1].key:
+        sciezka[-1].left = nowy
+    else:
+        sciezka[-1].right = nowy
+    if len(sciezka) <= math.log(drzewo.rozmiar, 1 / alfa):
+        return root
+
+    # Szukamy kozła ofiarnego idąc w górę ścieżki
+    dziecko, rozmiar_dziecka = nowy, 1
+    for i in range(len(sciezka) - 1, -1, -1):
+        node = sciezka[i]
+        brat = node.right if node.left is dziecko else node.left
+        rozmiar_wezla = 1 + rozmiar_dziecka + rozmiar(brat)
+        if rozmiar_dziecka > alfa * rozmiar_wezla:
+            przebudowane = przebuduj_poddrzewo(node)
+            if i == 0:
+                drzewo.root = przebudowane
+                return przebudowane
+            if sciezka[i - 1].left is node:
+                sciezka[i - 1].left = przebudowane
+            else:
+                sciezka[i - 1].right = przebudowane
+            return root
+        dziecko, rozmiar_dziecka = node, rozmiar_wezla
+    return root
+
+
+def usun_scapegoat(drzewo, key, alfa=ALFA_SCAPEGOAT):
+    """
+    Usuwa węzeł z drzewa scapegoat; gdy liczba węzłów spadnie poniżej
+    alfa * największej liczności od ostatniej przebudowy, przebudowuje całe drzewo.
+
+    :param drzewo: StanDrzewa (korzeń i liczność drzewa), aktualizowany w miejscu.
+    :param key: Usuwany klucz.
+    :param alfa: Współczynnik zrównoważenia.
+    :return: Korzeń drzewa po usunięciu.
+    """
+    node = szukanie_elementu(drzewo.root, key)
+    if node is None:
+        return drzewo.root
+    if licz_duplikaty and node.ile > 1:
+        node.ile -= 1
+        return drzewo.root
+    drzewo.root = usun_wezel(drzewo.root, key)
+    drzewo.rozmiar -= 1
+    if drzewo.rozmiar < alfa * drzewo.max_rozmiar:
+        drzewo.root = przebuduj_poddrzewo(drzewo.root)
+        drzewo.max_rozmiar = drzewo.rozmiar
+    return drzewo.root
+
+
+# =============================================================================
+# DRZEWO TRWAŁE (kopiowanie ścieżki)
+#
+# Funkcje Node (FCFS, usun_wezel, heapify_tree) zmieniają drzewo w miejscu.
+# Tutaj każda operacja zapisu kopiuje tylko węzły na ścieżce od korzenia do
+# miejsca zmiany i zwraca nowy korzeń – pozostałe poddrzewa są współdzielone
+# z poprzednią wersją. Wcześniejszy korzeń nadal opisuje niezmienioną wersję
+# drzewa, więc czytelnicy mogą z niej korzystać bez blokad.
+#
+# Węzłów WezelTrwaly nie wolno modyfikować po utworzeniu. Funkcje tylko
+# czytające (szukanie_elementu, wysokosc, klucze_malejaco, ...) działają na nich
+# bez zmian.
+# =============================================================================
+
+class WezelTrwaly(Node):
+    def __init__(self, value, left=None, right=None, ile=1):
+        super().__init__(value)
+        self.left = left
+        self.right = right
+        self.ile = ile
+        self.h = 1 + max(_h(left), _h(right))
+
+
+def _h(node):
+    """Wysokość zapamiętana w węźle trwałym (-1 dla pustego poddrzewa)."""
+    return node.h if node is not None else -1
+
+
+def _nowy_wezel_avl(key, left, right, ile=1):
+    """
+    Tworzy węzeł o kluczu key (z ile powtórzeniami) i dzieciach left, right,
+    wykonując co najwyżej jedną pojedynczą lub podwójną rotację, jeśli współczynnik
+    równowagi przekracza 1. Rotacje również tworzą nowe węzły zamiast zmieniać
+    stare; każdy przenoszony klucz zachowuje swój licznik.
+    """
+    if _h(left) - _h(right) > 1:
+        if _h(left.left) >= _h(left.right):
+            return WezelTrwaly(left.key, left.left, WezelTrwaly(key, left.right, right, ile), left.ile)
+        lr = left.right
+        return WezelTrwaly(lr.key, WezelTrwaly(left.key, left.left, lr.left, left.ile),
+                           WezelTrwaly(key, lr.right, right, ile), lr.ile)
+    if _h(right) - _h(left) > 1:
+        if _h(right.right) >= _h(right.left):
+            return WezelTrwaly(right.key, WezelTrwaly(key, left, right.left, ile), right.right, right.ile)
+        rl = right.left
+        return WezelTrwaly(rl.key, WezelTrwaly(key, left, rl.left, ile),
+                           WezelTrwaly(right.key, rl.right, right.right, right.ile), rl.ile)
+    return WezelTrwaly(key, left, right, ile)
+
+
+def na_trwale(node):
+    """
+    Kopiuje zwykłe drzewo (np. zbudowane funkcją AVL) na węzły trwałe.
+
+    :param node: Korzeń drzewa z węzłów Node.
+    :return: Korzeń kopii z węzłów WezelTrwaly.
+    """
+    if node is None:
+        return None
+    return WezelTrwaly(node.key, na_trwale(node.left), na_trwale(node.right), node.ile)
+
+
+def wstaw_trwale(root, key, rownowaz=True):
+    """
+    Wstawia klucz, zwracając nową wersję drzewa (O(log n) nowych węzłów dla AVL).
+    Równe klucze trafiają do prawego poddrzewa, tak jak w FCFS, a w trybie
+    licz_duplikaty zwiększają licznik kopii istniejącego węzła.
+
+    :param root: Korzeń bieżącej wersji.
+    :param key: Wstawiany klucz.
+    :param rownowaz: True – wstawianie AVL z rotacjami, False – zwykłe FCFS.
+    :return: Korzeń nowej wersji.
+    """
+    if root is None:
+        return WezelTrwaly(key)
+    if licz_duplikaty and key == root.key:
+        return WezelTrwaly(root.key, root.left, root.right, root.ile + 1)
+    nowy = _nowy_wezel_avl if rownowaz else WezelTrwaly
+    if key < root.key:
+        return nowy(root.key, wstaw_trwale(root.left, key, rownowaz), root.right, root.ile)
+    return nowy(root.key, root.left, wstaw_trwale(root.right, key, rownowaz), root.ile)
+
+
+def usun_trwale(root, key, rownowaz=True, wszystkie=False):
+    """
+    Usuwa węzeł o podanym kluczu, zwracając nową wersję drzewa.
+    Węzeł z dwojgiem dzieci zastępowany jest następnikiem (minimum prawego poddrzewa).
+    W trybie licz_duplikaty zmniejsza licznik kopii, chyba że wszystkie=True.
+
+    :param root: Korzeń bieżącej wersji.
+    :param key: Usuwany klucz.
+    :param rownowaz: True – usuwanie AVL z rotacjami, False – zwykłe BST.
+    :param wszystkie: Usuń węzeł razem ze wszystkimi powtórzeniami klucza.
+    :return: Korzeń nowej wersji (ten sam, jeśli klucza nie było).
+    """
+    if root is None:
+        return None
+    nowy = _nowy_wezel_avl if rownowaz else WezelTrwaly
+    if key < root.key:
+        left = usun_trwale(root.left, key, rownowaz, wszystkie)
+        return root if left is root.left else nowy(root.key, left, root.right, root.ile)
+    if key > root.key:
+        right = usun_trwale(root.right, key, rownowaz, wszystkie)
+        return root if right is root.right else nowy(root.key, root.left, right, root.ile)
+    if licz_duplikaty and root.ile > 1 and not wszystkie:
+        return WezelTrwaly(root.key, root.left, root.right, root.ile - 1)
+    if root.left is None:
+        return root.right
+    if root.right is None:
+        return root.left
+    temp = get_min(root.right)
+    return nowy(temp.key, root.left, usun_trwale(root.right, temp.key, rownowaz, True), temp.ile)
+
+
+class DrzewoTrwale:
+    """
+    Wersjonowane drzewo dla wielu czytelników i jednego pisarza.
+    Czytelnicy pobierają migawkę (korzeń) i przeszukują ją bez blokad;
+    zapisy są szeregowane blokadą i publikują nowy korzeń jednym przypisaniem.
+    """
+
+    def __init__(self, root=None, rownowaz=True):
+        # Zapisy czytają wysokość z węzłów współdzielonych ze starą wersją,
+        # więc zwykłe drzewo (np. FCFS) kopiujemy na węzły trwałe
+        if root is not None and not isinstance(root, WezelTrwaly):
+            root = na_trwale(root)
+        self.root = root
+        self.wersja = 0
+        self.rownowaz = rownowaz
+        self._zapis = threading.Lock()
+
+    def migawka(self):
+        """Zwraca korzeń bieżącej wersji – nie zmieni się on po kolejnych zapisach."""
+        return self.root
+
+    def wstaw(self, key):
+        with self._zapis:
+            self.root = wstaw_trwale(self.root, key, self.rownowaz)
+            self.wersja += 1
+            return self.root
+
+    def usun(self, key):
+        with self._zapis:
+            self.root = usun_trwale(self.root, key, self.rownowaz)
+            self.wersja += 1
+            return self.root
+
+
+# =============================================================================
+# PODZIAŁ, ŁĄCZENIE I WSTAWIANIE HURTOWE
+#
+# - podziel_drzewo i polacz_drzewa działają na drzewach AVL z węzłów trwałych
+#   (wysokość zapamiętana w węźle jest potrzebna, by łączyć w O(log n)).
+#   Takie węzły tworzy bezpośrednio funkcja AVL; inne drzewa można przenieść
+#   na nie funkcją na_trwale.
+# - wstaw_hurtowo scala posortowaną paczkę kluczy z in-orderem drzewa
+#   i buduje wynik od nowa, zamiast m razy wywoływać FCFS.
+# =============================================================================
+
+def _polacz_z_kluczem(lewe, key, prawe, ile=1):
+    """
+    Łączy dwa drzewa AVL i klucz rozdzielający (lewe <= key <= prawe).
+    Schodzi po grzbiecie wyższego drzewa do poddrzewa o wysokości zbliżonej
+    do niższego i równoważy ścieżkę powrotną – O(|h(lewe) - h(prawe)| + 1).
+    """
+    if _h(lewe) > _h(prawe) + 1:
+        return _nowy_wezel_avl(lewe.key, lewe.left, _polacz_z_kluczem(lewe.right, key, prawe, ile), lewe.ile)
+    if _h(prawe) > _h(lewe) + 1:
+        return _nowy_wezel_avl(prawe.key, _polacz_z_kluczem(lewe, key, prawe.left, ile), prawe.right, prawe.ile)
+    return WezelTrwaly(key, lewe, prawe, ile)
+
+
+def polacz_drzewa(lewe, prawe):
+    """
+    Łączy dwa drzewa AVL, w których wszystkie klucze lewego są nie większe
+    od kluczy prawego. Czas O(log n); drzewa wejściowe pozostają niezmienione.
+
+    :param lewe: Korzeń drzewa z mniejszymi kluczami.
+    :param prawe: Korzeń drzewa z większymi kluczami.
+    :return: Korzeń połączonego drzewa.
+    """
+    if prawe is None:
+        return lewe
+    if lewe is None:
+        return prawe
+    najmniejszy = get_min(prawe)
+    return _polacz_z_kluczem(lewe, najmniejszy.key, usun_trwale(prawe, najmniejszy.key, wszystkie=True),
+                             najmniejszy.ile)
+
+
+def podziel_drzewo(root, key):
+    """
+    Dzieli drzewo AVL na klucze mniejsze od key i klucze nie mniejsze od key.
+    Czas O(log n); drzewo wejściowe pozostaje niezmienione.
+
+    :param root: Korzeń drzewa.
+    :param key: Klucz podziału.
+    :return: Krotka (korzeń drzewa < key, korzeń drzewa >= key).
+    """
+    if root is None:
+        return None, None
+    if key <= root.key:
+        lewe, prawe = podziel_drzewo(root.left, key)
+        return lewe, _polacz_z_kluczem(prawe, root.key, root.right, root.ile)
+    lewe, prawe = podziel_drzewo(root.right, key)
+    return _polacz_z_kluczem(root.left, root.key, lewe, root.ile), prawe
+
+
+def _zbuduj_z_posortowanej(klucze, lo, hi, trwale):
+    """Buduje zbalansowane drzewo z rosnącego fragmentu klucze[lo:hi] bez kopiowania listy."""
+    if lo >= hi:
+        return None
+    mediana = (lo + hi) // 2
+    lewe = _zbuduj_z_posortowanej(klucze, lo, mediana, trwale)
+    prawe = _zbuduj_z_posortowanej(klucze, mediana + 1, hi, trwale)
+    if trwale:
+        return WezelTrwaly(klucze[mediana], lewe, prawe)
+    node = Node(klucze[mediana])
+    node.left = lewe
+    node.right = prawe
+    return node
+
+
+def wstaw_hurtowo(root, klucze, trwale=None):
+    """
+    Wstawia paczkę m kluczy do drzewa n-elementowego w czasie O(n + m)
+    (plus O(m log m), jeśli paczka nie jest posortowana). Wynikiem jest
+    nowe, zbalansowane drzewo tego samego rodzaju węzłów co root.
+
+    :param root: Korzeń drzewa BST (Node lub WezelTrwaly).
+    :param klucze: Wstawiane klucze.
+    :param trwale: Czy budować węzły trwałe; domyślnie według rodzaju root.
+    :return: Korzeń nowego drzewa.
+    """
+    if trwale is None:
+        trwale = isinstance(root, WezelTrwaly)
+    if any(klucze[i] > klucze[i + 1] for i in range(len(klucze) - 1)):
+        klucze = sorted(klucze)
+    istniejace = list(klucze_malejaco(root))
+    istniejace.reverse()
+    scalone = list(heapq.merge(istniejace, klucze))
+    if not licz_duplikaty:
+        return _zbuduj_z_posortowanej(scalone, 0, len(scalone), trwale)
+    licznik = Counter(scalone)
+    unikalne = list(licznik)
+    root = _zbuduj_z_posortowanej(unikalne, 0, len(unikalne), trwale)
+    ustaw_liczniki(root, licznik)
+    return root
+
+
 # =============================================================================
 # FUNKCJA GENERUJACA
 # =============================================================================
@@ -439,6 +949,239 @@ def generuj_ciag_posortowany(n: int, min_val=1, max_val=1000000):
     return ciag
 
 
+# =============================================================================
+# TRYB WSADOWY
+#
+# Polecenia czytane są linia po linii z pliku lub stdin, a wyniki zbierane
+# i zapisywane hurtowo – bez input(), clear() i pomiarów czasu z menu.
+# Jedno polecenie daje dokładnie jedną linię wyniku.
+#
+#   buduj TYP k1 k2 ...            TYP: AVL, FCFS, SCAPEGOAT, HMIN
+#   wczytaj TYP plik
+#   generuj TYP losowy|posortowany n
+#   szukaj k | wstaw k | wstaw_wiele k1 k2 ... | usun k | poziom k | zakres a b
+#   licznosc k | min | max | wysokosc | malejaco | rownowaz
+#   podziel k | polacz             tylko AVL: odkłada klucze >= k / dołącza je z powrotem
+#   duplikaty tak|nie              zliczanie powtórzeń w węzłach (przebudowuje drzewo)
+# =============================================================================
+
+TYPY_DRZEW = ('AVL', 'FCFS', 'SCAPEGOAT', 'HMIN')
+POLECENIA = ('buduj', 'wczytaj', 'generuj', 'duplikaty', 'szukaj', 'licznosc', 'wstaw', 'wstaw_wiele',
+             'usun', 'poziom', 'zakres', 'min', 'max', 'wysokosc', 'malejaco', 'rownowaz',
+             'podziel', 'polacz')
+# Polecenia, które tylko czytają drzewo (serwer wykonuje je paczkami między zapisami)
+POLECENIA_ODCZYTU = ('szukaj', 'licznosc', 'poziom', 'zakres', 'min', 'max', 'wysokosc', 'malejaco')
+
+
+def zbuduj_drzewo(typ, dane):
+    """
+    Buduje drzewo wybranego typu z listy kluczy (tak jak menu wybierz_typ_drzewa).
+
+    :param typ: Jeden z TYPY_DRZEW.
+    :param dane: Lista kluczy (może zostać posortowana w miejscu).
+    :return: StanDrzewa z korzeniem zbudowanego drzewa.
+    """
+    global is_HMIN
+    if typ not in TYPY_DRZEW:
+        raise ValueError(f"nieznany typ drzewa: {typ}")
+    is_HMIN = False
+    drzewo = StanDrzewa(typ)
+    if licz_duplikaty and typ in ('AVL', 'HMIN'):
+        # Każdy klucz trafia do drzewa raz, a liczba powtórzeń do licznika węzła
+        licznik = Counter(dane)
+        unikalne = list(licznik)
+        if typ == 'AVL':
+            heap_sort(unikalne)
+            drzewo.root = AVL(unikalne)
+        else:
+            drzewo.root = HMIN(unikalne)
+        ustaw_liczniki(drzewo.root, licznik)
+    elif typ == 'AVL':
+        heap_sort(dane)
+        drzewo.root = AVL(dane)
+    elif typ == 'HMIN':
+        drzewo.root = HMIN(dane)
+    elif typ == 'SCAPEGOAT':
+        for n in dane:
+            FCFS_scapegoat(drzewo, n)
+    else:
+        for n in dane:
+            drzewo.root = FCFS(drzewo.root, n)
+    return drzewo
+
+
+def wykonaj_polecenie(drzewo, slowa, dozwolone=None):
+    """
+    Wykonuje jedno polecenie trybu wsadowego na drzewie.
+
+    :param drzewo: StanDrzewa bieżącego drzewa (None, jeśli jeszcze nie zbudowano).
+    :param slowa: Polecenie podzielone na słowa.
+    :param dozwolone: Zbiór dopuszczalnych poleceń (None – wszystkie z POLECENIA).
+    :return: Krotka (StanDrzewa po poleceniu, linia wyniku).
+    """
+    global licz_duplikaty
+    polecenie, argumenty = slowa[0], slowa[1:]
+    if dozwolone is not None and polecenie not in dozwolone:
+        raise ValueError(f"polecenie niedostępne: {polecenie}")
+    if polecenie == 'buduj':
+        return zbuduj_drzewo(argumenty[0], list(map(int, argumenty[1:]))), "ok"
+    if polecenie == 'wczytaj':
+        with open(argumenty[1], 'r') as f:
+            dane = list(map(int, f.read().split()))
+        return zbuduj_drzewo(argumenty[0], dane), "ok"
+    if polecenie == 'generuj':
+        n = int(argumenty[2])
+        if argumenty[1] == 'posortowany':
+            dane = generuj_ciag_posortowany(n)
+        elif argumenty[1] == 'losowy':
+            dane = generuj_ciag_losowy(n)
+        else:
+            raise ValueError(f"nieznany rodzaj ciągu: {argumenty[1]}")
+        return zbuduj_drzewo(argumenty[0], dane), "ok"
+
+    if polecenie == 'duplikaty':
+        if argumenty[0] not in ('tak', 'nie'):
+            raise ValueError(f"oczekiwano tak lub nie: {argumenty[0]}")
+        if licz_duplikaty == (argumenty[0] == 'tak'):
+            return drzewo, "ok"
+        licz_duplikaty = argumenty[0] == 'tak'
+        if drzewo is None:
+            return drzewo, "ok"
+        # Drzewo zbudowane w poprzednim trybie przebudowujemy w nowym
+        nowe = zbuduj_drzewo(drzewo.typ, list(klucze_poziomami(drzewo.root)))
+        if drzewo.schowek is not None:
+            nowe.schowek = zbuduj_drzewo('AVL', list(klucze_poziomami(drzewo.schowek))).root
+        return nowe, "ok"
+    if drzewo is None:
+        raise ValueError("drzewo nie zostało zbudowane")
+    root, typ = drzewo.root, drzewo.typ
+    if polecenie == 'wysokosc':
+        return drzewo, str(wysokosc(root))
+    if polecenie == 'wstaw_wiele':
+        if is_HMIN:
+            raise ValueError("wstawianie niedostępne dla HMIN")
+        drzewo.root = wstaw_hurtowo(root, list(map(int, argumenty)), typ == 'AVL')
+        drzewo.rozmiar = drzewo.max_rozmiar = rozmiar(drzewo.root)
+        return drzewo, "ok"
+    if polecenie == 'wstaw':
+        if is_HMIN:
+            raise ValueError("wstawianie niedostępne dla HMIN")
+        if typ == 'SCAPEGOAT':
+            FCFS_scapegoat(drzewo, int(argumenty[0]))
+        elif typ == 'AVL':
+            drzewo.root = wstaw_trwale(root, int(argumenty[0]))
+        else:
+            drzewo.root = FCFS(root, int(argumenty[0]))
+        return drzewo, "ok"
+    if polecenie in ('podziel', 'polacz'):
+        if typ != 'AVL':
+            raise ValueError("podział i łączenie dostępne tylko dla AVL")
+        if polecenie == 'podziel':
+            if drzewo.schowek is not None:
+                raise ValueError("schowek jest zajęty – najpierw polacz")
+            drzewo.root, drzewo.schowek = podziel_drzewo(root, int(argumenty[0]))
+            return drzewo, "ok"
+        if drzewo.schowek is None:
+            raise ValueError("schowek jest pusty – najpierw podziel")
+        if root is not None and get_max(root).key > get_min(drzewo.schowek).key:
+            raise ValueError("klucze drzewa są większe od kluczy schowka")
+        drzewo.root, drzewo.schowek = polacz_drzewa(root, drzewo.schowek), None
+        return drzewo, "ok"
+    if polecenie == 'szukaj':
+        return drzewo, "tak" if szukanie_elementu(root, int(argumenty[0])) else "nie"
+    if polecenie == 'licznosc':
+        klucz = int(argumenty[0])
+        if licz_duplikaty:
+            node = szukanie_elementu(root, klucz)
+            return drzewo, str(node.ile if node else 0)
+        # Bez zliczania każde powtórzenie jest osobnym węzłem
+        return drzewo, str(len(elementy_z_zakresu(root, klucz, klucz)))
+    if polecenie == 'usun':
+        if is_HMIN:
+            raise ValueError("usuwanie niedostępne dla HMIN")
+        klucz = int(argumenty[0])
+        if szukanie_elementu(root, klucz) is None:
+            return drzewo, "nie"
+        if typ == 'SCAPEGOAT':
+            usun_scapegoat(drzewo, klucz)
+        elif typ == 'AVL':
+            drzewo.root = usun_trwale(root, klucz)
+        else:
+            drzewo.root = usun_wezel(root, klucz)
+        return drzewo, "ok"
+    if polecenie == 'poziom':
+        poziom, el = poziom_i_elementy_na_poziomie(root, int(argumenty[0]))
+        return drzewo, " ".join(map(str, [poziom] + el))
+    if polecenie == 'zakres':
+        el = elementy_z_zakresu(root, int(argumenty[0]), int(argumenty[1]))
+        return drzewo, " ".join(map(str, el))
+    if polecenie in ('min', 'max') and root is None:
+        raise ValueError("drzewo jest puste")
+    if polecenie == 'min':
+        if is_HMIN:
+            return drzewo, str(root.key)
+        return drzewo, str(get_min(root).key)
+    if polecenie == 'max':
+        if is_HMIN:
+            return drzewo, str(max(elementy_z_zakresu(root, root.key, float('inf'))))
+        return drzewo, str(get_max(root).key)
+    if polecenie == 'malejaco':
+        if is_HMIN and root is not None:
+            return drzewo, " ".join(map(str, reversed(elementy_z_zakresu(root, root.key, float('inf')))))
+        return drzewo, " ".join(map(str, klucze_malejaco(root)))
+    if polecenie == 'rownowaz':
+        if is_HMIN:
+            raise ValueError("równoważenie niedostępne dla HMIN")
+        if typ != 'AVL':
+            # Drzewo AVL jest równoważone przy każdym zapisie
+            drzewo.root = rownowazenie_drzewa(root)
+        return drzewo, "ok"
+    raise ValueError(f"nieznane polecenie: {polecenie}")
+
+
+def wykonaj_bezpiecznie(drzewo, slowa, dozwolone=None):
+    """
+    Wykonuje polecenie jak wykonaj_polecenie, ale błąd zamienia na linię
+    "blad: ..." zamiast go zgłaszać. Wspólne dla trybu wsadowego i serwera, aby
+    jedna błędna linia nie przerywała żadnego z nich.
+
+    :param drzewo: StanDrzewa bieżącego drzewa (lub None).
+    :param slowa: Polecenie podzielone na słowa.
+    :param dozwolone: Zbiór dopuszczalnych poleceń (None – wszystkie).
+    :return: Krotka (StanDrzewa po poleceniu, linia wyniku).
+    """
+    try:
+        return wykonaj_polecenie(drzewo, slowa, dozwolone)
+    except Exception as e:
+        return drzewo, f"blad: {e}"
+
+
+def tryb_wsadowy(wejscie, wyjscie, rozmiar_paczki=10000):
+    """
+    Odtwarza strumień poleceń na jednym, trzymanym w pamięci drzewie.
+    Wyniki są buforowane i zapisywane paczkami po rozmiar_paczki linii.
+    Błędne polecenie daje linię "blad: ..." i nie przerywa przetwarzania.
+
+    :param wejscie: Plik (lub stdin) z poleceniami.
+    :param wyjscie: Plik (lub stdout) na wyniki.
+    :param rozmiar_paczki: Liczba linii wyniku zapisywanych naraz.
+    """
+    drzewo = None
+    wyniki = []
+    for linia in wejscie:
+        slowa = linia.split()
+        if not slowa or slowa[0].startswith('#'):
+            continue
+        drzewo, wynik = wykonaj_bezpiecznie(drzewo, slowa)
+        wyniki.append(wynik)
+        if len(wyniki) >= rozmiar_paczki:
+            wyjscie.write("\n".join(wyniki) + "\n")
+            wyniki = []
+    if wyniki:
+        wyjscie.write("\n".join(wyniki) + "\n")
+    wyjscie.flush()
+
+
 # =============================================================================
 # INTERFEJS UŻYTKOWNIKA
 # =============================================================================
@@ -705,37 +1448,46 @@ def wybierz_dane():
 
 
 def wybierz_typ_drzewa(dane):
+    global licz_duplikaty
     while True:
         print("\nWybierz typ drzewa:")
         print("1. AVL")
         print("2. BST (FCFS)")
         print("3. HMIN")
+        print("4. BST (FCFS + scapegoat)")
+        print(f"5. Zliczanie duplikatów w węzłach: {'tak' if licz_duplikaty else 'nie'} (przełącz)")
         print("0. Powrót")
         wybor = input("> ")
         if wybor == '1':
             start_czas = time.time()
-            heap_sort(dane)
-            r = AVL(dane)
+            r = zbuduj_drzewo('AVL', dane).root
             koniec_czas = time.time()
             czas = koniec_czas - start_czas
             print(f"Czas utworzenia drzewa AVL wynosi : {czas:.6f} s")
             return r
         elif wybor == '2':
             start_czas = time.time()
-            root = Node(dane[0])
-            for n in dane[1:]:
-                FCFS(root, n)
+            root = zbuduj_drzewo('FCFS', dane).root
             koniec_czas = time.time()
             czas = koniec_czas - start_czas
             print(f"Czas utworzenia drzewa metoda FCFS wynosi : {czas:.6f} s")
             return root
+        elif wybor == '4':
+            start_czas = time.time()
+            r = zbuduj_drzewo('SCAPEGOAT', dane).root
+            koniec_czas = time.time()
+            czas = koniec_czas - start_czas
+            print(f"Czas utworzenia drzewa metoda FCFS (scapegoat) wynosi : {czas:.6f} s")
+            return r
         elif wybor == '3':
             start_czas = time.time()
-            r = HMIN(dane)
+            r = zbuduj_drzewo('HMIN', dane).root
             koniec_czas = time.time()
             czas = koniec_czas - start_czas
             print(f"Czas utworzenia drzewa metoda HMIN wynosi : {czas:.6f} s")
             return r
+        elif wybor == '5':
+            licz_duplikaty = not licz_duplikaty
         elif wybor == '0':
             return None
         else:
@@ -817,4 +1569,11 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    # python main.py --wsadowy [plik_polecen [plik_wynikow]]
+    if len(sys.argv) > 1 and sys.argv[1] == '--wsadowy':
+        with contextlib.ExitStack() as pliki:
+            wejscie = pliki.enter_context(open(sys.argv[2], 'r')) if len(sys.argv) > 2 else sys.stdin
+            wyjscie = pliki.enter_context(open(sys.argv[3], 'w')) if len(sys.argv) > 3 else sys.stdout
+            tryb_wsadowy(wejscie, wyjscie)
+    else:
+        main()
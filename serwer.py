@@ -0,0 +1,190 @@
+import asyncio
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import main
+
+
+# =============================================================================
+# SERWER DRZEWA (asyncio)
+#
+# Jedno drzewo trzymane jest w pamięci i obsługuje wielu klientów naraz.
+# Protokół jest taki sam jak w trybie wsadowym (main.tryb_wsadowy): jedna linia
+# polecenia -> jedna linia wyniku, w tej samej kolejności.
+#
+# - Klient może wysyłać polecenia potokowo, bez czekania na odpowiedzi.
+# - Polecenia wszystkich klientów trafiają do wspólnej kolejki. Wykonawca
+#   pobiera naraz wszystko, co już czeka, i dzieli to w kolejności przybycia na
+#   serie: kolejne odczyty (main.POLECENIA_ODCZYTU) idą jedną paczką, a każdy
+#   zapis osobno, dopiero po odczytach, które przyszły przed nim.
+# - Polecenia wykonuje jeden wątek roboczy, więc drzewo nie wymaga blokad,
+#   a długie operacje (generuj, malejaco) nie blokują pętli zdarzeń.
+#   Jedno zadanie wątku obejmuje najwyżej MAKS_SERIA poleceń, więc wyniki
+#   wracają na bieżąco, a zamknięcie serwera czeka co najwyżej na jedną serię.
+# - Przepływ jest ograniczony: po każdej odpowiedzi serwer czeka, aż bufor
+#   wysyłania opróżni się poniżej progu transportu, a klient może mieć
+#   najwyżej MAKS_OCZEKUJACYCH poleceń bez odesłanej odpowiedzi. Klient, który
+#   nie odbiera wyników, zatrzymuje więc tylko czytanie własnych poleceń.
+# - Serwer nie wykonuje poleceń sięgających do plików (wczytaj) – klient
+#   sieciowy nie może otworzyć dowolnej ścieżki na maszynie serwera.
+# =============================================================================
+
+ROZMIAR_KOLEJKI = 10000
+MAKS_OCZEKUJACYCH = 100
+MAKS_SERIA = 100
+POLECENIA_SERWERA = frozenset(main.POLECENIA) - {'wczytaj'}
+LIMIT_LINII = 2 ** 26  # malejaco i wstaw_wiele mogą dawać bardzo długie linie
+
+
+class SerwerDrzewa:
+    def __init__(self):
+        self.drzewo = None
+        self.kolejka = asyncio.Queue(ROZMIAR_KOLEJKI)
+        self.zadanie = None
+        self.klienci = set()
+        self.watek = ThreadPoolExecutor(max_workers=1)
+
+    def wykonaj(self, slowa):
+        """
+        Wykonuje jedno polecenie na drzewie serwera.
+
+        :param slowa: Polecenie podzielone na słowa.
+        :return: Linia wyniku.
+        """
+        # Wykonawca jest wspólny dla wszystkich klientów – błąd jednego
+        # polecenia nie może go zatrzymać
+        self.drzewo, wynik = main.wykonaj_bezpiecznie(self.drzewo, slowa, POLECENIA_SERWERA)
+        return wynik
+
+    def wykonaj_serie(self, polecenia):
+        """Wykonuje serię poleceń w wątku roboczym i zwraca listę wyników."""
+        return [self.wykonaj(slowa) for slowa in polecenia]
+
+    async def wykonawca(self):
+        """Pobiera z kolejki paczki oczekujących poleceń i wykonuje je seriami."""
+        petla = asyncio.get_running_loop()
+        while True:
+            paczka = [await self.kolejka.get()]
+            while not self.kolejka.empty():
+                paczka.append(self.kolejka.get_nowait())
+            i = 0
+            while i < len(paczka):
+                # Odczyty do najbliższego zapisu idą jedną serią (najwyżej
+                # MAKS_SERIA poleceń), zapis – sam
+                j = i + 1
+                if paczka[i][0][0] in main.POLECENIA_ODCZYTU:
+                    while (j < len(paczka) and j - i < MAKS_SERIA
+                           and paczka[j][0][0] in main.POLECENIA_ODCZYTU):
+                        j += 1
+                seria = paczka[i:j]
+                wyniki = await petla.run_in_executor(
+                    self.watek, self.wykonaj_serie, [slowa for slowa, _ in seria])
+                for (_, przyszlosc), wynik in zip(seria, wyniki):
+                    if not przyszlosc.cancelled():
+                        przyszlosc.set_result(wynik)
+                i = j
+
+    async def obsluz_klienta(self, reader, writer):
+        """
+        Czyta polecenia klienta i odsyła wyniki w kolejności poleceń.
+        Po każdej odpowiedzi czeka, aż klient odbierze dane (drain), a przy
+        MAKS_OCZEKUJACYCH poleceniach bez odpowiedzi przestaje czytać następne.
+        Po rozłączeniu klienta pozostałe wyniki są pomijane.
+
+        :param reader: Strumień wejściowy połączenia.
+        :param writer: Strumień wyjściowy połączenia.
+        """
+        petla = asyncio.get_running_loop()
+        self.klienci.add(asyncio.current_task())
+        oczekujace = asyncio.Queue(MAKS_OCZEKUJACYCH)
+
+        async def odsylaj():
+            while True:
+                przyszlosc = await oczekujace.get()
+                if przyszlosc is None:
+                    break
+                wynik = await przyszlosc
+                if writer.is_closing():
+                    continue
+                writer.write((wynik + "\n").encode())
+                try:
+                    await writer.drain()
+                except ConnectionError:
+                    writer.close()
+
+        nadawca = asyncio.create_task(odsylaj())
+        try:
+            while not writer.is_closing():
+                try:
+                    linia = await reader.readline()
+                except ConnectionError:
+                    break
+                if not linia:
+                    break
+                slowa = linia.decode().split()
+                if not slowa or slowa[0].startswith('#'):
+                    continue
+                przyszlosc = petla.create_future()
+                await self.kolejka.put((slowa, przyszlosc))
+                await oczekujace.put(przyszlosc)
+            await oczekujace.put(None)
+            await nadawca
+        except asyncio.CancelledError:
+            pass  # serwer jest zamykany
+        finally:
+            nadawca.cancel()
+            writer.close()
+            self.klienci.discard(asyncio.current_task())
+
+
+async def uruchom_serwer(host='127.0.0.1', port=8765, sciezka=None):
+    """
+    Uruchamia serwer drzewa na porcie TCP lub gnieździe uniksowym.
+
+    :param host: Adres nasłuchiwania TCP.
+    :param port: Port TCP (0 – wybrany przez system).
+    :param sciezka: Ścieżka gniazda uniksowego; jeśli podana, zamiast TCP.
+    :return: Krotka (obiekt asyncio.Server, SerwerDrzewa).
+    """
+    drzewo = SerwerDrzewa()
+    if sciezka is not None:
+        serwer = await asyncio.start_unix_server(drzewo.obsluz_klienta, path=sciezka, limit=LIMIT_LINII)
+    else:
+        serwer = await asyncio.start_server(drzewo.obsluz_klienta, host, port, limit=LIMIT_LINII)
+    drzewo.zadanie = asyncio.create_task(drzewo.wykonawca())
+    return serwer, drzewo
+
+
+async def zatrzymaj_serwer(serwer, drzewo):
+    """
+    Zamyka serwer i otwarte połączenia, zatrzymuje wykonawcę poleceń i jego
+    wątek roboczy.
+
+    :param serwer: Obiekt asyncio.Server z uruchom_serwer.
+    :param drzewo: SerwerDrzewa z uruchom_serwer.
+    """
+    serwer.close()
+    zadania = [drzewo.zadanie, *drzewo.klienci]
+    for zadanie in zadania:
+        zadanie.cancel()
+    await asyncio.gather(*zadania, return_exceptions=True)
+    await serwer.wait_closed()
+    drzewo.watek.shutdown(wait=False, cancel_futures=True)
+
+
+async def _main(argumenty):
+    if argumenty and argumenty[0] == '--unix':
+        serwer, drzewo = await uruchom_serwer(sciezka=argumenty[1])
+    else:
+        host = argumenty[0] if len(argumenty) > 0 else '127.0.0.1'
+        port = int(argumenty[1]) if len(argumenty) > 1 else 8765
+        serwer, drzewo = await uruchom_serwer(host, port)
+    try:
+        await serwer.serve_forever()
+    finally:
+        await zatrzymaj_serwer(serwer, drzewo)
+
+
+if __name__ == "__main__":
+    # python serwer.py [host [port]]  lub  python serwer.py --unix ścieżka
+    asyncio.run(_main(sys.argv[1:]))
@@ -0,0 +1,619 @@
+import contextlib
+import random
+import sys
+import time
+import tracemalloc
+from abc import ABC, abstractmethod
+
+import main
+from main import Node
+
+
+# =============================================================================
+# WSPÓLNY INTERFEJS STRUKTUR
+#
+# Każdy silnik udostępnia te same operacje, dzięki czemu porownaj_silniki może
+# mierzyć je na identycznych danych:
+#   buduj(dane), wstaw(k), usun(k), szukaj(k), minimum(), maksimum(),
+#   malejaco() (iterator), wysokosc()
+#
+# Dla pustej struktury minimum() i maksimum() zgłaszają ValueError, a malejaco()
+# nie zwraca żadnego klucza.
+#
+# Silniki trzymają stan w obiekcie i można ich używać równocześnie. Adaptery
+# struktur z main (AVL, FCFS, SCAPEGOAT, HMIN) nie wyszukują przez
+# main.is_HMIN, a wywołując funkcje zależne od tej flagi, ustawiają ją na czas
+# wywołania i przywracają poprzednią wartość. Tryb main.licz_duplikaty pozostaje
+# wspólnym ustawieniem adapterów; nowe silniki (czerwono-czarne, treap, lista
+# skokowa) zawsze zliczają powtórzenia klucza w węźle.
+# =============================================================================
+
+PUSTA = "struktura jest pusta"
+
+
+class Drzewo(ABC):
+    nazwa = None
+    # Górna granica liczby wyszukiwań w porownaj_silniki (None – bez limitu)
+    MAKS_SZUKAN = None
+
+    @abstractmethod
+    def buduj(self, dane):
+        """Buduje strukturę z listy kluczy (zastępuje dotychczasową zawartość)."""
+
+    @abstractmethod
+    def wstaw(self, key):
+        """Wstawia jedno wystąpienie klucza."""
+
+    @abstractmethod
+    def usun(self, key):
+        """Usuwa jedno wystąpienie klucza; zwraca False, jeśli go nie było."""
+
+    @abstractmethod
+    def szukaj(self, key):
+        """Zwraca True, jeśli klucz występuje w strukturze."""
+
+    @abstractmethod
+    def minimum(self):
+        """Najmniejszy klucz; ValueError dla pustej struktury."""
+
+    @abstractmethod
+    def maksimum(self):
+        """Największy klucz; ValueError dla pustej struktury."""
+
+    @abstractmethod
+    def malejaco(self):
+        """Iterator po kluczach w porządku malejącym (z powtórzeniami)."""
+
+    @abstractmethod
+    def wysokosc(self):
+        """Wysokość struktury."""
+
+
+def _znajdz(node, key):
+    """Iteracyjne wyszukiwanie w BST (bez zależności od main.is_HMIN)."""
+    while node is not None and node.key != key:
+        node = node.left if key < node.key else node.right
+    return node
+
+
+@contextlib.contextmanager
+def _flaga_hmin(wartosc):
+    """Ustawia main.is_HMIN na czas bloku i przywraca poprzednią wartość."""
+    poprzednia = main.is_HMIN
+    main.is_HMIN = wartosc
+    try:
+        yield
+    finally:
+        main.is_HMIN = poprzednia
+
+
+class DrzewoBinarne(Drzewo):
+    """Operacje odczytu wspólne dla silników opartych na BST (korzeń w self.root)."""
+
+    def __init__(self):
+        self.root = None
+
+    def szukaj(self, key):
+        return _znajdz(self.root, key) is not None
+
+    def minimum(self):
+        if self.root is None:
+            raise ValueError(PUSTA)
+        return main.get_min(self.root).key
+
+    def maksimum(self):
+        if self.root is None:
+            raise ValueError(PUSTA)
+        return main.get_max(self.root).key
+
+    def malejaco(self):
+        return main.klucze_malejaco(self.root)
+
+    def wysokosc(self):
+        return main.wysokosc(self.root)
+
+
+# =============================================================================
+# Adaptery istniejących struktur
+# =============================================================================
+
+class DrzewoBST(DrzewoBinarne):
+    typ = None
+
+    def __init__(self):
+        super().__init__()
+        self.stan = main.StanDrzewa(self.typ)
+
+    def buduj(self, dane):
+        # zbuduj_drzewo przestawia main.is_HMIN – po budowie wraca poprzednia wartość
+        with _flaga_hmin(main.is_HMIN):
+            self.stan = main.zbuduj_drzewo(self.typ, list(dane))
+        self.root = self.stan.root
+
+    def wstaw(self, key):
+        self.root = main.FCFS(self.root, key)
+
+    def usun(self, key):
+        if _znajdz(self.root, key) is None:
+            return False
+        self.root = main.usun_wezel(self.root, key)
+        return True
+
+
+class DrzewoAVL(DrzewoBST):
+    """AVL na węzłach trwałych; wstawianie i usuwanie z rotacjami."""
+    nazwa = typ = 'AVL'
+
+    def wstaw(self, key):
+        self.root = main.wstaw_trwale(self.root, key)
+
+    def usun(self, key):
+        if _znajdz(self.root, key) is None:
+            return False
+        self.root = main.usun_trwale(self.root, key)
+        return True
+
+
+class DrzewoFCFS(DrzewoBST):
+    nazwa = typ = 'FCFS'
+
+
+class DrzewoScapegoat(DrzewoBST):
+    nazwa = typ = 'SCAPEGOAT'
+
+    def wstaw(self, key):
+        self.root = main.FCFS_scapegoat(self.stan, key)
+
+    def usun(self, key):
+        if _znajdz(self.root, key) is None:
+            return False
+        # usun_scapegoat szuka klucza przez main.szukanie_elementu
+        with _flaga_hmin(False):
+            self.root = main.usun_scapegoat(self.stan, key)
+        return True
+
+
+def _szukaj_w_kopcu(node, key):
+    """Szuka klucza w kopcu minimalnym, pomijając poddrzewa o korzeniu większym od klucza."""
+    stos = [node]
+    while stos:
+        node = stos.pop()
+        if node is None or node.key > key:
+            continue
+        if node.key == key:
+            return node
+        stos.append(node.left)
+        stos.append(node.right)
+    return None
+
+
+class KopiecHMIN(DrzewoBST):
+    nazwa = typ = 'HMIN'
+    # Wyszukiwanie w kopcu w najgorszym razie przegląda cały kopiec (O(n)),
+    # więc porownaj_silniki mierzy je na ograniczonej próbce kluczy
+    MAKS_SZUKAN = 1000
+
+    def wstaw(self, key):
+        raise ValueError("wstawianie niedostępne dla HMIN")
+
+    def usun(self, key):
+        raise ValueError("usuwanie niedostępne dla HMIN")
+
+    def szukaj(self, key):
+        return _szukaj_w_kopcu(self.root, key) is not None
+
+    def minimum(self):
+        if self.root is None:
+            raise ValueError(PUSTA)
+        return self.root.key
+
+    def maksimum(self):
+        if self.root is None:
+            raise ValueError(PUSTA)
+        return max(main.klucze_poziomami(self.root))
+
+    def malejaco(self):
+        return iter(sorted(main.klucze_poziomami(self.root), reverse=True))
+
+
+# =============================================================================
+# Drzewo czerwono-czarne (wariant lewostronny, LLRB)
+#
+# Czerwone krawędzie mogą prowadzić tylko do lewego dziecka, co sprowadza
+# naprawę po wstawieniu i usunięciu do trzech przypadków (_napraw).
+# =============================================================================
+
+class WezelRB(Node):
+    def __init__(self, value):
+        super().__init__(value)
+        self.czerwony = True
+
+
+def _czerwony(node):
+    return node is not None and node.czerwony
+
+
+def _obrot_w_lewo(h):
+    x = h.right
+    h.right = x.left
+    x.left = h
+    x.czerwony = h.czerwony
+    h.czerwony = True
+    return x
+
+
+def _obrot_w_prawo(h):
+    x = h.left
+    h.left = x.right
+    x.right = h
+    x.czerwony = h.czerwony
+    h.czerwony = True
+    return x
+
+
+def _zmien_kolory(h):
+    h.czerwony = not h.czerwony
+    h.left.czerwony = not h.left.czerwony
+    h.right.czerwony = not h.right.czerwony
+
+
+def _napraw(h):
+    if _czerwony(h.right) and not _czerwony(h.left):
+        h = _obrot_w_lewo(h)
+    if _czerwony(h.left) and _czerwony(h.left.left):
+        h = _obrot_w_prawo(h)
+    if _czerwony(h.left) and _czerwony(h.right):
+        _zmien_kolory(h)
+    return h
+
+
+def _czerwony_w_lewo(h):
+    _zmien_kolory(h)
+    if _czerwony(h.right.left):
+        h.right = _obrot_w_prawo(h.right)
+        h = _obrot_w_lewo(h)
+        _zmien_kolory(h)
+    return h
+
+
+def _czerwony_w_prawo(h):
+    _zmien_kolory(h)
+    if _czerwony(h.left.left):
+        h = _obrot_w_prawo(h)
+        _zmien_kolory(h)
+    return h
+
+
+def _rb_wstaw(h, key):
+    if h is None:
+        return WezelRB(key)
+    if key == h.key:
+        h.ile += 1
+    elif key < h.key:
+        h.left = _rb_wstaw(h.left, key)
+    else:
+        h.right = _rb_wstaw(h.right, key)
+    return _napraw(h)
+
+
+def _rb_usun_min(h):
+    if h.left is None:
+        return None
+    if not _czerwony(h.left) and not _czerwony(h.left.left):
+        h = _czerwony_w_lewo(h)
+    h.left = _rb_usun_min(h.left)
+    return _napraw(h)
+
+
+def _rb_usun(h, key):
+    """Usuwa węzeł z kluczem key (musi istnieć w drzewie)."""
+    if key < h.key:
+        if not _czerwony(h.left) and not _czerwony(h.left.left):
+            h = _czerwony_w_lewo(h)
+        h.left = _rb_usun(h.left, key)
+    else:
+        if _czerwony(h.left):
+            h = _obrot_w_prawo(h)
+        if key == h.key and h.right is None:
+            return None
+        if not _czerwony(h.right) and not _czerwony(h.right.left):
+            h = _czerwony_w_prawo(h)
+        if key == h.key:
+            temp = main.get_min(h.right)
+            h.key, h.ile = temp.key, temp.ile
+            h.right = _rb_usun_min(h.right)
+        else:
+            h.right = _rb_usun(h.right, key)
+    return _napraw(h)
+
+
+class DrzewoCzerwonoCzarne(DrzewoBinarne):
+    nazwa = 'RB'
+
+    def buduj(self, dane):
+        self.root = None
+        for key in dane:
+            self.wstaw(key)
+
+    def wstaw(self, key):
+        self.root = _rb_wstaw(self.root, key)
+        self.root.czerwony = False
+
+    def usun(self, key):
+        node = _znajdz(self.root, key)
+        if node is None:
+            return False
+        if node.ile > 1:
+            node.ile -= 1
+            return True
+        if not _czerwony(self.root.left) and not _czerwony(self.root.right):
+            self.root.czerwony = True
+        self.root = _rb_usun(self.root, key)
+        if self.root is not None:
+            self.root.czerwony = False
+        return True
+
+
+# =============================================================================
+# Treap (drzewo BST z kopcem losowych priorytetów)
+# =============================================================================
+
+class WezelTreap(Node):
+    def __init__(self, value):
+        super().__init__(value)
+        self.priorytet = random.random()
+
+
+def _rotacja_prawa(node):
+    x = node.left
+    node.left = x.right
+    x.right = node
+    return x
+
+
+def _rotacja_lewa(node):
+    x = node.right
+    node.right = x.left
+    x.left = node
+    return x
+
+
+def _treap_wstaw(node, key):
+    if node is None:
+        return WezelTreap(key)
+    if key == node.key:
+        node.ile += 1
+    elif key < node.key:
+        node.left = _treap_wstaw(node.left, key)
+        if node.left.priorytet < node.priorytet:
+            node = _rotacja_prawa(node)
+    else:
+        node.right = _treap_wstaw(node.right, key)
+        if node.right.priorytet < node.priorytet:
+            node = _rotacja_lewa(node)
+    return node
+
+
+def _treap_usun(node, key):
+    """Spycha węzeł z kluczem key rotacjami do liścia i go odcina."""
+    if node is None:
+        return None
+    if key < node.key:
+        node.left = _treap_usun(node.left, key)
+    elif key > node.key:
+        node.right = _treap_usun(node.right, key)
+    elif node.left is None:
+        return node.right
+    elif node.right is None:
+        return node.left
+    elif node.left.priorytet < node.right.priorytet:
+        node = _rotacja_prawa(node)
+        node.right = _treap_usun(node.right, key)
+    else:
+        node = _rotacja_lewa(node)
+        node.left = _treap_usun(node.left, key)
+    return node
+
+
+class Treap(DrzewoBinarne):
+    nazwa = 'TREAP'
+
+    def buduj(self, dane):
+        self.root = None
+        for key in dane:
+            self.wstaw(key)
+
+    def wstaw(self, key):
+        self.root = _treap_wstaw(self.root, key)
+
+    def usun(self, key):
+        node = _znajdz(self.root, key)
+        if node is None:
+            return False
+        if node.ile > 1:
+            node.ile -= 1
+        else:
+            self.root = _treap_usun(self.root, key)
+        return True
+
+
+# =============================================================================
+# Lista skokowa
+#
+# Nie jest drzewem, ale daje oczekiwane O(log n) dla tych samych operacji.
+# Wysokością nazywamy liczbę używanych poziomów.
+# =============================================================================
+
+class WezelListy:
+    def __init__(self, key, poziomy):
+        self.key = key
+        self.ile = 1
+        self.nastepne = [None] * poziomy
+
+
+class ListaSkokowa(Drzewo):
+    nazwa = 'SKIPLIST'
+    MAKS_POZIOM = 32
+
+    def __init__(self):
+        self.glowa = WezelListy(None, self.MAKS_POZIOM)
+        self.poziom = 1
+
+    def _losuj_poziom(self):
+        poziom = 1
+        while poziom < self.MAKS_POZIOM and random.random() < 0.5:
+            poziom += 1
+        return poziom
+
+    def _poprzednicy(self, key):
+        """Ostatni węzeł z kluczem < key na każdym poziomie."""
+        poprzednicy = [self.glowa] * self.MAKS_POZIOM
+        node = self.glowa
+        for i in range(self.poziom - 1, -1, -1):
+            while node.nastepne[i] is not None and node.nastepne[i].key < key:
+                node = node.nastepne[i]
+            poprzednicy[i] = node
+        return poprzednicy
+
+    def buduj(self, dane):
+        self.glowa = WezelListy(None, self.MAKS_POZIOM)
+        self.poziom = 1
+        for key in dane:
+            self.wstaw(key)
+
+    def wstaw(self, key):
+        poprzednicy = self._poprzednicy(key)
+        node = poprzednicy[0].nastepne[0]
+        if node is not None and node.key == key:
+            node.ile += 1
+            return
+        poziom = self._losuj_poziom()
+        self.poziom = max(self.poziom, poziom)
+        nowy = WezelListy(key, poziom)
+        for i in range(poziom):
+            nowy.nastepne[i] = poprzednicy[i].nastepne[i]
+            poprzednicy[i].nastepne[i] = nowy
+
+    def usun(self, key):
+        poprzednicy = self._poprzednicy(key)
+        node = poprzednicy[0].nastepne[0]
+        if node is None or node.key != key:
+            return False
+        if node.ile > 1:
+            node.ile -= 1
+            return True
+        for i in range(len(node.nastepne)):
+            poprzednicy[i].nastepne[i] = node.nastepne[i]
+        while self.poziom > 1 and self.glowa.nastepne[self.poziom - 1] is None:
+            self.poziom -= 1
+        return True
+
+    def szukaj(self, key):
+        node = self._poprzednicy(key)[0].nastepne[0]
+        return node is not None and node.key == key
+
+    def minimum(self):
+        if self.glowa.nastepne[0] is None:
+            raise ValueError(PUSTA)
+        return self.glowa.nastepne[0].key
+
+    def maksimum(self):
+        if self.glowa.nastepne[0] is None:
+            raise ValueError(PUSTA)
+        node = self.glowa
+        for i in range(self.poziom - 1, -1, -1):
+            while node.nastepne[i] is not None:
+                node = node.nastepne[i]
+        return node.key
+
+    def malejaco(self):
+        klucze = []
+        node = self.glowa.nastepne[0]
+        while node is not None:
+            klucze.extend([node.key] * node.ile)
+            node = node.nastepne[0]
+        return reversed(klucze)
+
+    def wysokosc(self):
+        return self.poziom
+
+
+SILNIKI = (DrzewoAVL, DrzewoFCFS, DrzewoScapegoat, KopiecHMIN,
+           DrzewoCzerwonoCzarne, Treap, ListaSkokowa)
+
+
+# =============================================================================
+# PORÓWNANIE SILNIKÓW
+# =============================================================================
+
+def _zmierz(operacja, klucze):
+    start_czas = time.time()
+    for k in klucze:
+        operacja(k)
+    return time.time() - start_czas
+
+
+def _nowe_klucze(dane, m, min_val=1, max_val=1000000):
+    """
+    Losuje m różnych kluczy spoza dane z tego samego zakresu co generatory
+    danych, aby wstawienia trafiały w całe drzewo, a nie tylko za maksimum.
+    """
+    obecne = set(dane)
+    nowe = []
+    while len(nowe) < m:
+        k = random.randrange(min_val, max_val)
+        if k not in obecne:
+            obecne.add(k)
+            nowe.append(k)
+    return nowe
+
+
+def porownaj_silniki(rozmiary=(1000, 10000, 100000), silniki=SILNIKI, posortowane=False):
+    """
+    Dla każdego rozmiaru danych i silnika mierzy czas budowy, n wyszukiwań,
+    n/10 wstawień i n/10 usunięć oraz pamięć zajętą przez zbudowaną strukturę.
+    Wszystkie silniki dostają te same dane i te same klucze operacji. Silniki
+    z limitem MAKS_SZUKAN (HMIN) wykonują tylko tyle wyszukiwań, a czas dla n
+    jest ekstrapolowany i oznaczony „~”.
+
+    :param rozmiary: Liczby elementów.
+    :param silniki: Klasy silników do porównania.
+    :param posortowane: True – dane rosnące, False – losowe.
+    """
+    print(f"{'silnik':<10} {'n':>7} {'budowa':>10} {'szukaj':>10} {'wstaw':>10} {'usun':>10} "
+          f"{'pamięć KB':>10} {'wysokość':>9}")
+    for n in rozmiary:
+        dane = main.generuj_ciag_posortowany(n) if posortowane else main.generuj_ciag_losowy(n)
+        szukane = random.sample(dane, n)
+        nowe = _nowe_klucze(dane, n // 10)
+        usuwane = random.sample(dane, n // 10)
+        for klasa in silniki:
+            # Pamięć mierzona na osobnej budowie – śledzenie alokacji spowalnia pomiar czasu
+            tracemalloc.start()
+            silnik = klasa()
+            silnik.buduj(list(dane))
+            pamiec = tracemalloc.get_traced_memory()[0] / 1024
+            tracemalloc.stop()
+            silnik = klasa()
+            start_czas = time.time()
+            silnik.buduj(list(dane))
+            czas_budowy = time.time() - start_czas
+
+            limit = klasa.MAKS_SZUKAN
+            if limit is not None and limit < n:
+                czas_szukania = f"~{_zmierz(silnik.szukaj, szukane[:limit]) * n / limit:.6f}"
+            else:
+                czas_szukania = f"{_zmierz(silnik.szukaj, szukane):.6f}"
+            wysokosc = silnik.wysokosc()
+            try:
+                czas_wstawiania = f"{_zmierz(silnik.wstaw, nowe):.6f}"
+                czas_usuwania = f"{_zmierz(silnik.usun, usuwane):.6f}"
+            except ValueError:
+                czas_wstawiania = czas_usuwania = "-"
+            print(f"{klasa.nazwa:<10} {n:>7} {czas_budowy:>10.6f} {czas_szukania:>10} "
+                  f"{czas_wstawiania:>10} {czas_usuwania:>10} {pamiec:>10.1f} {wysokosc:>9}")
+
+
+if __name__ == "__main__":
+    # python silniki.py [n1 n2 ...]
+    porownaj_silniki(tuple(map(int, sys.argv[1:])) or (1000, 10000, 100000))
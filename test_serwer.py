@@ -0,0 +1,91 @@
+import asyncio
+import os
+import random
+import socket
+import tempfile
+import unittest
+
+from klient import Klient
+from serwer import uruchom_serwer, zatrzymaj_serwer
+
+
+class TestSerwer(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.serwer, self.drzewo = await uruchom_serwer('127.0.0.1', 0)
+        self.port = self.serwer.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        await zatrzymaj_serwer(self.serwer, self.drzewo)
+
+    async def test_potok_dwoch_klientow(self):
+        a = await Klient.polacz('127.0.0.1', self.port)
+        b = await Klient.polacz('127.0.0.1', self.port)
+        self.assertEqual(await a.polecenie("buduj FCFS 5 3 8"), "ok")
+        klucze = random.sample(range(100, 5100), 5000)
+        wyniki_a, wyniki_b = await asyncio.gather(
+            a.polecenia([f"wstaw {k}" for k in klucze]),
+            b.polecenia(["szukaj 3", "szukaj 4", "min", "max"] * 1250),
+        )
+        self.assertEqual(len(wyniki_a), 5000)
+        self.assertTrue(all(w == "ok" for w in wyniki_a))
+        self.assertEqual(wyniki_b[:3], ["tak", "nie", "3"])
+        self.assertEqual(await b.polecenie("max"), "5099")
+        await a.zamknij()
+        await b.zamknij()
+
+    async def test_bledy_i_rozlaczenie(self):
+        a = await Klient.polacz('127.0.0.1', self.port)
+        self.assertTrue((await a.polecenie("szukaj 1")).startswith("blad:"))
+        porzucony = await Klient.polacz('127.0.0.1', self.port)
+        porzucony.writer.write(b"generuj AVL losowy 20000\n" + b"malejaco\n" * 50)
+        await porzucony.writer.drain()
+        porzucony.writer.close()
+        self.assertEqual(await a.polecenie("buduj AVL 1 2 3"), "ok")
+        self.assertEqual(await a.polecenie("malejaco"), "3 2 1")
+        await a.zamknij()
+
+    async def test_klient_nieodbierajacy_wynikow(self):
+        wykonane = []
+        wykonaj_serie = self.drzewo.wykonaj_serie
+
+        def zliczaj(polecenia):
+            wykonane.append(len(polecenia))
+            return wykonaj_serie(polecenia)
+
+        self.drzewo.wykonaj_serie = zliczaj
+        a = await Klient.polacz('127.0.0.1', self.port)
+        self.assertEqual(await a.polecenie("generuj AVL losowy 20000"), "ok")
+        a.writer.write(b"malejaco\n" * 8000)
+        await asyncio.sleep(1)
+        # Serwer wstrzymuje się na nieodebranych odpowiedziach zamiast wykonać wszystko
+        self.assertLess(sum(wykonane), 1000)
+        self.assertTrue(all(n <= 100 for n in wykonane))
+        b = await Klient.polacz('127.0.0.1', self.port)
+        self.assertEqual(await b.polecenie("szukaj -1"), "nie")
+        a.writer.close()
+        await b.zamknij()
+
+    async def test_brak_dostepu_do_plikow(self):
+        a = await Klient.polacz('127.0.0.1', self.port)
+        wynik = await a.polecenie("wczytaj AVL /etc/passwd")
+        self.assertEqual(wynik, "blad: polecenie niedostępne: wczytaj")
+        await a.zamknij()
+
+
+@unittest.skipUnless(hasattr(socket, 'AF_UNIX'), "brak gniazd uniksowych")
+class TestSerwerUnix(unittest.IsolatedAsyncioTestCase):
+    async def test_gniazdo_uniksowe(self):
+        with tempfile.TemporaryDirectory() as katalog:
+            sciezka = os.path.join(katalog, 'drzewo.sock')
+            serwer, drzewo = await uruchom_serwer(sciezka=sciezka)
+            try:
+                klient = await Klient.polacz(sciezka=sciezka)
+                wyniki = await klient.polecenia(["buduj AVL 4 2 6", "wstaw 5", "szukaj 5", "min"])
+                self.assertEqual(wyniki[2:], ["tak", "2"])
+                await klient.zamknij()
+            finally:
+                await zatrzymaj_serwer(serwer, drzewo)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+import math
+import random
+import unittest
+from collections import Counter
+
+import main
+import silniki
+
+
+def in_order(root):
+    return list(main.klucze_malejaco(root))[::-1]
+
+
+def sprawdz_avl(test, node):
+    """Sprawdza równowagę AVL i zapamiętaną wysokość; zwraca wysokość."""
+    if node is None:
+        return -1
+    hl, hr = sprawdz_avl(test, node.left), sprawdz_avl(test, node.right)
+    test.assertLessEqual(abs(hl - hr), 1)
+    test.assertEqual(node.h, 1 + max(hl, hr))
+    return node.h
+
+
+def czarna_wysokosc(test, node):
+    """Sprawdza warunki LLRB i zwraca liczbę czarnych węzłów do liścia."""
+    if node is None:
+        return 0
+    test.assertFalse(silniki._czerwony(node.right))
+    if node.czerwony:
+        test.assertFalse(silniki._czerwony(node.left))
+    lewa, prawa = czarna_wysokosc(test, node.left), czarna_wysokosc(test, node.right)
+    test.assertEqual(lewa, prawa)
+    return lewa + (0 if node.czerwony else 1)
+
+
+class TestSilniki(unittest.TestCase):
+    def setUp(self):
+        main.licz_duplikaty = False
+        random.seed(1)
+
+    def tearDown(self):
+        main.licz_duplikaty = False
+
+    def test_zgodnosc_z_licznikiem(self):
+        for tryb in (False, True):
+            main.licz_duplikaty = tryb
+            for klasa in silniki.SILNIKI:
+                dane = [random.randrange(200) for _ in range(300)]
+                silnik = klasa()
+                silnik.buduj(dane)
+                wzorzec = Counter(dane)
+                if klasa is not silniki.KopiecHMIN:
+                    for _ in range(600):
+                        k = random.randrange(220)
+                        if random.random() < 0.5:
+                            silnik.wstaw(k)
+                            wzorzec[k] += 1
+                        else:
+                            self.assertEqual(silnik.usun(k), wzorzec[k] > 0, (klasa.nazwa, tryb))
+                            if wzorzec[k]:
+                                wzorzec[k] -= 1
+                oczekiwane = sorted(wzorzec.elements(), reverse=True)
+                self.assertEqual(list(silnik.malejaco()), oczekiwane, (klasa.nazwa, tryb))
+                self.assertEqual(silnik.minimum(), oczekiwane[-1])
+                self.assertEqual(silnik.maksimum(), oczekiwane[0])
+                for k in range(220):
+                    self.assertEqual(silnik.szukaj(k), wzorzec[k] > 0, (klasa.nazwa, tryb, k))
+
+    def test_pusta_struktura(self):
+        for klasa in silniki.SILNIKI:
+            silnik = klasa()
+            silnik.buduj([])
+            self.assertRaises(ValueError, silnik.minimum)
+            self.assertRaises(ValueError, silnik.maksimum)
+            self.assertEqual(list(silnik.malejaco()), [])
+            self.assertFalse(silnik.szukaj(1))
+
+    def test_niezmienniki(self):
+        rb, avl, treap, lista = (silniki.DrzewoCzerwonoCzarne(), silniki.DrzewoAVL(),
+                                 silniki.Treap(), silniki.ListaSkokowa())
+        for silnik in (rb, avl, treap, lista):
+            silnik.buduj(random.sample(range(5000), 1000))
+        for _ in range(2000):
+            k = random.randrange(5000)
+            for silnik in (rb, avl, treap, lista):
+                silnik.wstaw(k) if random.random() < 0.5 else silnik.usun(k)
+        self.assertFalse(rb.root.czerwony)
+        czarna_wysokosc(self, rb.root)
+        sprawdz_avl(self, avl.root)
+        stos = [treap.root]
+        while stos:
+            node = stos.pop()
+            for dziecko in (node.left, node.right):
+                if dziecko is not None:
+                    self.assertGreaterEqual(dziecko.priorytet, node.priorytet)
+                    stos.append(dziecko)
+        for i in range(lista.poziom):
+            klucze, node = [], lista.glowa.nastepne[i]
+            while node is not None:
+                klucze.append(node.key)
+                node = node.nastepne[i]
+            self.assertEqual(klucze, sorted(set(klucze)))
+
+    def test_nowe_klucze(self):
+        dane = main.generuj_ciag_losowy(1000)
+        nowe = silniki._nowe_klucze(dane, 100)
+        self.assertEqual(len(set(nowe)), 100)
+        self.assertFalse(set(nowe) & set(dane))
+        self.assertTrue(all(1 <= k < 1000000 for k in nowe))
+        self.assertLess(min(nowe), max(dane))
+
+
+class TestPodzialIScapegoat(unittest.TestCase):
+    def setUp(self):
+        main.licz_duplikaty = False
+        random.seed(2)
+
+    def test_podziel_i_polacz(self):
+        for _ in range(50):
+            dane = [random.randrange(300) for _ in range(random.randrange(1, 200))]
+            root = main.zbuduj_drzewo('AVL', list(dane)).root
+            k = random.randrange(-10, 310)
+            lewe, prawe = main.podziel_drzewo(root, k)
+            sprawdz_avl(self, lewe)
+            sprawdz_avl(self, prawe)
+            self.assertEqual(in_order(lewe), sorted(x for x in dane if x < k))
+            self.assertEqual(in_order(prawe), sorted(x for x in dane if x >= k))
+            polaczone = main.polacz_drzewa(lewe, prawe)
+            sprawdz_avl(self, polaczone)
+            self.assertEqual(in_order(polaczone), sorted(dane))
+            self.assertEqual(in_order(root), sorted(dane))
+
+    def test_wstaw_hurtowo(self):
+        dane = random.sample(range(1000), 300)
+        paczka = random.sample(range(1000, 2000), 100) + dane[:10]
+        root = main.wstaw_hurtowo(main.zbuduj_drzewo('AVL', list(dane)).root, paczka, True)
+        sprawdz_avl(self, root)
+        self.assertEqual(in_order(root), sorted(dane + paczka))
+
+    def test_scapegoat(self):
+        drzewo = main.StanDrzewa('SCAPEGOAT')
+        wzorzec = Counter()
+        for _ in range(3000):
+            k = random.randrange(1000)
+            if random.random() < 0.6:
+                main.FCFS_scapegoat(drzewo, k)
+                wzorzec[k] += 1
+            elif wzorzec[k]:
+                main.usun_scapegoat(drzewo, k)
+                wzorzec[k] -= 1
+            self.assertEqual(drzewo.rozmiar, main.rozmiar(drzewo.root))
+            self.assertGreaterEqual(drzewo.max_rozmiar, drzewo.rozmiar)
+        self.assertEqual(in_order(drzewo.root), sorted(wzorzec.elements()))
+        granica = math.log(drzewo.max_rozmiar, 1 / main.ALFA_SCAPEGOAT) + 1
+        self.assertLessEqual(main.wysokosc(drzewo.root), granica)
+
+
+if __name__ == "__main__":
+    unittest.main()
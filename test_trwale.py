@@ -0,0 +1,65 @@
+import random
+import threading
+import unittest
+
+import main
+
+
+def klucze(root):
+    return list(main.klucze_malejaco(root))[::-1]
+
+
+class TestDrzewoTrwale(unittest.TestCase):
+    def setUp(self):
+        main.licz_duplikaty = False
+
+    def test_zwykle_drzewo_fcfs(self):
+        drzewo = main.DrzewoTrwale(main.zbuduj_drzewo('FCFS', [5, 3, 8, 1, 4]).root, rownowaz=False)
+        drzewo.wstaw(7)
+        drzewo.usun(3)
+        self.assertEqual(klucze(drzewo.migawka()), [1, 4, 5, 7, 8])
+
+    def test_migawka_nie_zmienia_sie(self):
+        drzewo = main.DrzewoTrwale(main.zbuduj_drzewo('AVL', list(range(100))).root)
+        stara = drzewo.migawka()
+        for k in range(100, 200):
+            drzewo.wstaw(k)
+        for k in range(0, 100, 2):
+            drzewo.usun(k)
+        self.assertEqual(klucze(stara), list(range(100)))
+        self.assertEqual(klucze(drzewo.migawka()), list(range(1, 100, 2)) + list(range(100, 200)))
+        self.assertEqual(drzewo.wersja, 150)
+
+    def test_czytelnicy_i_pisarz(self):
+        # Pisarz wstawia rosnące klucze; każda migawka musi być spójnym
+        # prefiksem 0..k-1 i zrównoważonym drzewem AVL
+        drzewo = main.DrzewoTrwale()
+        n = 3000
+        bledy = []
+        koniec = threading.Event()
+
+        def czytelnik():
+            while not koniec.is_set():
+                migawka = drzewo.migawka()
+                k = klucze(migawka)
+                if k != list(range(len(k))):
+                    bledy.append(k)
+                if migawka is not None and migawka.h > 1.45 * max(1, len(k)).bit_length():
+                    bledy.append(migawka.h)
+                if k and not main.szukanie_elementu(migawka, random.choice(k)):
+                    bledy.append("szukaj")
+
+        watki = [threading.Thread(target=czytelnik) for _ in range(4)]
+        for watek in watki:
+            watek.start()
+        for k in range(n):
+            drzewo.wstaw(k)
+        koniec.set()
+        for watek in watki:
+            watek.join()
+        self.assertEqual(bledy, [])
+        self.assertEqual(klucze(drzewo.migawka()), list(range(n)))
+
+
+if __name__ == "__main__":
+    unittest.main()
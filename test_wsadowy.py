@@ -0,0 +1,38 @@
+import io
+import unittest
+
+import main
+
+
+def odtworz(polecenia):
+    wyjscie = io.StringIO()
+    main.tryb_wsadowy(io.StringIO("\n".join(polecenia) + "\n"), wyjscie)
+    return wyjscie.getvalue().split("\n")[:-1]
+
+
+class TestTrybWsadowy(unittest.TestCase):
+    def setUp(self):
+        main.licz_duplikaty = False
+
+    def test_zapytania_o_puste_drzewo(self):
+        wyniki = odtworz(["buduj FCFS 5", "usun 5", "szukaj 5", "licznosc 5", "usun 5",
+                          "zakres 1 9", "malejaco", "min", "max"])
+        self.assertEqual(wyniki[2:7], ["nie", "0", "nie", "", ""])
+        self.assertTrue(wyniki[7].startswith("blad:"))
+        self.assertTrue(wyniki[8].startswith("blad:"))
+
+    def test_bledna_linia_nie_przerywa(self):
+        wyniki = odtworz(["szukaj 1", "buduj AVL 1 2 3", "wstaw x", "generuj AVL", "malejaco"])
+        self.assertTrue(all(w.startswith("blad:") for w in wyniki[:1] + wyniki[2:4]))
+        self.assertEqual(wyniki[4], "3 2 1")
+
+    def test_licznosc(self):
+        for tryb in ("nie", "tak"):
+            for typ in main.TYPY_DRZEW:
+                wyniki = odtworz([f"duplikaty {tryb}", f"buduj {typ} 3 7 3 1 3 7",
+                                  "licznosc 3", "licznosc 7", "licznosc 5"])
+                self.assertEqual(wyniki[2:], ["3", "2", "0"], (tryb, typ))
+
+
+if __name__ == "__main__":
+    unittest.main()